@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+"""
+Executa o detector de fraudes sobre vários corpora numa mesma invocação
+(ex.: 983json do MPSC e ndmais_articles_json), compartilhando:
+
+- um único pool de chamadas ao LLM (--workers requisições simultâneas ao Ollama)
+- um único cache de resultados (indexado pela impressão digital da requisição)
+- um único arquivo de checkpoints (todas as notícias já analisadas, por corpus)
+
+Cada corpus mantém seus próprios arquivos de saída (JSON, CSV e métricas) e o
+escalonamento é feito em rodízio entre os corpora, para que uma ingestão longa
+não monopolize o servidor enquanto outro corpus espera.
+
+Dentro de cada corpus as notícias são processadas da mais curta para a mais
+longa (custo estimado a partir do tamanho do arquivo, com a latência aprendida
+dos execution_time_seconds já registrados), com prioridade opcional para
+corpora ou datas específicas. O console mostra vazão e ETA calculados sobre as
+últimas notícias concluídas.
+
+Uso:
+    python3 job_runner.py \\
+        --corpus 983json=/home/paulo/projects/main-server/.PAULO/983json \\
+        --corpus ndmais=/home/paulo/projects/main-server/.PAULO/dataset_building/ndmais_articles_json \\
+        --workers 4
+"""
+
+import re
+import json
+import time
+import datetime
+import heapq
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from main import (
+    DEFAULT_CACHE_FILE,
+    FraudDetector,
+    OllamaError403,
+    ResultCache,
+    SELECTED_MODEL,
+    TIMEOUT_SECONDS,
+    MAX_CONSECUTIVE_403_ERRORS,
+    build_csv_row,
+    build_metrics_data,
+    default_analysis,
+    is_transient_failure,
+    postprocess,
+    print_execution_metrics,
+    save_csv_incremental,
+    save_results_json,
+)
+
+SAVE_INTERVAL = 25  # Salvar saídas de cada corpus a cada N notícias processadas
+DEFAULT_WORKERS = 2
+DEFAULT_CHECKPOINT_FILE = "checkpoints.jsonl"
+ETA_WINDOW = 50  # Notícias recentes usadas no cálculo de vazão e ETA
+PROGRESS_INTERVAL = 10  # Imprimir vazão/ETA a cada N notícias concluídas
+# Campos de data procurados nos JSONs das notícias (--priority-since); os scrapers
+# do MPSC e do NDMais não documentam o nome, então --date-field permite informá-lo
+DATE_FIELDS = ("date", "published_at", "data", "data_publicacao", "datetime")
+
+
+class CheckpointStore:
+    """
+    Registro append-only (JSONL) das notícias já analisadas em cada corpus.
+    Diferente do JSON de resultados, registra também as notícias sem fraude.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._done: Dict[str, set] = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._done.setdefault(record['corpus'], set()).add(record['file'])
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def processed(self, corpus: str) -> set:
+        return self._done.get(corpus, set())
+
+    def mark(self, corpus: str, file_names: List[str]):
+        """Registra notícias concluídas; chamado só depois que as saídas do corpus foram salvas."""
+        done = self._done.setdefault(corpus, set())
+        for file_name in file_names:
+            done.add(file_name)
+            self._file.write(json.dumps({"corpus": corpus, "file": file_name}, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class CostModel:
+    """
+    Estimativa de latência por notícia: regressão linear do execution_time_seconds
+    sobre o tamanho do arquivo JSON (aproximação barata do tamanho do texto, obtida
+    sem abrir o arquivo).
+    """
+
+    def __init__(self):
+        self.samples = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+        self.intercept = 0.0
+        self.slope = 1.0  # Sem histórico: custo proporcional ao tamanho
+
+    def add(self, file_size: int, seconds: float):
+        if file_size <= 0 or seconds <= 0:
+            return
+        self.samples += 1
+        self._sum_x += file_size
+        self._sum_y += seconds
+        self._sum_xx += file_size * file_size
+        self._sum_xy += file_size * seconds
+
+    def fit(self):
+        if not self.samples:
+            return
+        mean_x = self._sum_x / self.samples
+        mean_y = self._sum_y / self.samples
+        var_x = self._sum_xx / self.samples - mean_x * mean_x
+        cov_xy = self._sum_xy / self.samples - mean_x * mean_y
+        if var_x > 0 and cov_xy > 0:
+            self.slope = cov_xy / var_x
+            self.intercept = max(mean_y - self.slope * mean_x, 0.0)
+        else:
+            # Histórico pequeno ou sem correlação: manter a ordenação por tamanho
+            self.slope = mean_y / mean_x
+            self.intercept = 0.0
+
+    def predict(self, file_size: int) -> float:
+        return self.intercept + self.slope * file_size
+
+
+class ProgressTracker:
+    """
+    Vazão e ETA calculados sobre as últimas ETA_WINDOW notícias analisadas pelo LLM
+    (não sobre a média da execução inteira). O custo restante é a soma das
+    estimativas do CostModel, então o ETA já considera que as notícias longas
+    ficam para o final.
+    """
+
+    def __init__(self, total_items: int, total_cost: float):
+        self.remaining_items = total_items
+        self.remaining_cost = total_cost
+        self.completed = 0
+        self._window = deque(maxlen=ETA_WINDOW)
+        self._window_start = time.time()  # Conclusão anterior à primeira da janela
+
+    def done(self, estimated_cost: float, analyzed: bool = True):
+        """Registra uma notícia concluída; analyzed=False para cache/erro de leitura."""
+        self.completed += 1
+        self.remaining_items -= 1
+        self.remaining_cost = max(self.remaining_cost - estimated_cost, 0.0)
+        if analyzed:
+            if len(self._window) == self._window.maxlen:
+                self._window_start = self._window[0][0]
+            self._window.append((time.time(), estimated_cost))
+
+    def report(self) -> str:
+        if self._window:
+            span = max(time.time() - self._window_start, 1e-6)
+            per_minute = len(self._window) / span * 60
+            cost_rate = sum(cost for _, cost in self._window) / span
+        else:
+            per_minute = 0.0
+            cost_rate = 0.0
+        eta = self.remaining_cost / cost_rate if cost_rate > 0 else None
+        return (f"📈 Progresso: {self.completed} concluídas, {self.remaining_items} restantes | "
+                f"{per_minute:.1f} notícias/min (últimas {len(self._window)}) | "
+                f"ETA: {_format_duration(eta)}")
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}m{secs:02d}s"
+
+
+class Corpus:
+    """
+    Estado de processamento de um corpus: notícias pendentes e resultados acumulados.
+    """
+
+    def __init__(self, name: str, input_dir: str, output_dir: str):
+        self.name = name
+        self.input_path = Path(input_dir)
+        output_path = Path(output_dir)
+        self.output_file = str(output_path / f"fraud_detection_{name}_results.json")
+        self.csv_file = str(output_path / f"fraud_news_{name}_with_companies.csv")
+        self.metrics_file = str(output_path / f"performance_metrics_{name}.json")
+
+        self.pending: List[tuple] = []  # Heap de (prioridade, custo estimado, nome, caminho)
+        self.total_files = 0
+        self.processed = 0
+        self.skipped = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.parse_failures = 0
+        self.cache_hits = 0
+        self.fraud_news: List[Dict] = []
+        self.fraud_news_with_companies: List[Dict] = []
+        self._checkpoints: Optional[CheckpointStore] = None
+        self._unsaved: List[str] = []  # Concluídas desde o último save(), ainda sem checkpoint
+
+    def load(self, checkpoints: CheckpointStore, start_from: int = 0) -> bool:
+        """
+        Carrega resultados parciais e monta a lista de notícias pendentes.
+        Retorna False se a pasta de entrada não existir.
+        """
+        if not self.input_path.exists():
+            print(f"ERRO: Diretório {self.input_path} do corpus '{self.name}' não encontrado!")
+            return False
+
+        self._checkpoints = checkpoints
+        # Retomar resultados anteriores deste corpus (mesmo formato do main.py)
+        already_processed = set(checkpoints.processed(self.name))
+        try:
+            with open(self.output_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.fraud_news = data.get('fraud_news', [])
+            self.processed = data.get('total_processed', 0)
+        except (OSError, json.JSONDecodeError):
+            self.fraud_news = []
+        for entry in self.fraud_news:
+            already_processed.add(entry['file'])
+            analysis = entry.get('analysis', {})
+            if analysis.get('companies_involved'):
+                self.fraud_news_with_companies.append(
+                    build_csv_row(entry['file'], entry['title'], entry['url'], '', analysis)
+                )
+        self.processed = max(self.processed, len(already_processed))
+
+        json_files = sorted(self.input_path.glob("*.json"))
+        self.total_files = len(json_files)
+        for index, json_file in enumerate(json_files, start=1):
+            if (start_from > 0 and index < start_from) or json_file.name in already_processed:
+                self.skipped += 1
+                continue
+            self.pending.append(json_file)
+        return True
+
+    def history(self) -> List[tuple]:
+        """(arquivo, tamanho do arquivo, execution_time_seconds) das fraudes já registradas."""
+        samples = []
+        for entry in self.fraud_news:
+            try:
+                file_size = (self.input_path / entry['file']).stat().st_size
+            except OSError:
+                continue
+            samples.append((entry['file'], file_size, entry['analysis'].get('execution_time_seconds', 0)))
+        return samples
+
+    def schedule(self, cost_model: CostModel, prioritized: bool = False, priority_since: Optional[str] = None,
+                 date_fields: tuple = DATE_FIELDS):
+        """
+        Ordena as notícias pendentes pela menor latência estimada (shortest-job-first).
+        Notícias prioritárias (corpus prioritário ou data >= priority_since) vêm antes.
+        """
+        heap = []
+        dated = 0
+        check_dates = bool(priority_since) and not prioritized
+        for json_file in self.pending:
+            file_size = json_file.stat().st_size
+            tier = 0 if prioritized else 1
+            if check_dates:
+                # Exige abrir o JSON, então só é feito quando --priority-since é usado
+                date = _read_article_date(json_file, date_fields)
+                if date:
+                    dated += 1
+                    if date >= priority_since:
+                        tier = 0
+            heap.append((tier, cost_model.predict(file_size), json_file.name, json_file))
+        heapq.heapify(heap)
+        self.pending = heap
+        if check_dates and heap and not dated:
+            print(f"⚠ [{self.name}] Nenhuma notícia pendente tem data reconhecível nos campos "
+                  f"{', '.join(date_fields)} - --priority-since não tem efeito neste corpus")
+
+    def pending_cost(self) -> float:
+        return sum(item[1] for item in self.pending)
+
+    def record(self, json_file: Path, title: str, url: str, text: str, result: Dict):
+        """Registra o resultado de uma notícia e imprime o resumo no console."""
+        self.processed += 1
+        self._unsaved.append(json_file.name)
+
+        prefix = f"[{self.name} {self.processed}/{self.total_files}] {json_file.name}"
+        fraud_entry, csv_row = postprocess(json_file.name, title, url, text, result)
+        if not fraud_entry:
+            print(f"{prefix}\n  ✗ Não relacionada a fraude empresarial")
+            return
+
+        self.fraud_news.append(fraud_entry)
+        print(f"{prefix}\n  ✓ FRAUDE DETECTADA (confiança: {result['confidence']}) - Tempo: {result.get('execution_time_seconds', 0)}s")
+        print(f"    Tipos: {', '.join(result['fraud_types'])}")
+        if csv_row:
+            print(f"    Empresas: {', '.join(result['companies_involved'])}")
+            self.fraud_news_with_companies.append(csv_row)
+        else:
+            print(f"    ⚠ Sem empresas identificadas - não será incluída no CSV")
+        if result['people_involved']:
+            print(f"    Pessoas: {', '.join(result['people_involved'])}")
+
+    def record_failure(self, json_file: Path, result: Dict):
+        """
+        Contabiliza uma análise que falhou por motivo transitório (timeout, erro de
+        conexão). A notícia não recebe checkpoint, então é tentada de novo na próxima
+        execução.
+        """
+        if result.get('error') == "timeout":
+            self.timeouts += 1
+        else:
+            self.failures += 1
+        print(f"[{self.name}] {json_file.name}\n  ⚠ Análise falhou ({result.get('error')}) - será refeita na próxima execução")
+
+    def save(self, **extra):
+        """
+        Salva JSON e CSV parciais do corpus e, só então, os checkpoints das notícias
+        concluídas desde o último save (assim um checkpoint nunca aponta para um
+        resultado que não chegou ao disco).
+        """
+        save_results_json(self.output_file, self.processed, self.fraud_news, self.fraud_news_with_companies, **extra)
+        save_csv_incremental(self.csv_file, self.fraud_news_with_companies)
+        if self._checkpoints is not None and self._unsaved:
+            self._checkpoints.mark(self.name, self._unsaved)
+            self._unsaved = []
+
+    def finalize(self):
+        """Salva as saídas finais e as métricas do corpus."""
+        self.save()
+        metrics_data = build_metrics_data(self.processed, self.fraud_news, self.fraud_news_with_companies)
+        metrics_data["corpus"] = self.name
+        metrics_data["processing_summary"]["cache_hits"] = self.cache_hits
+        metrics_data["processing_summary"]["timeouts"] = self.timeouts
+        metrics_data["processing_summary"]["failures"] = self.failures
+        metrics_data["processing_summary"]["parse_failures"] = self.parse_failures
+        with open(self.metrics_file, 'w', encoding='utf-8') as f:
+            json.dump(metrics_data, f, ensure_ascii=False, indent=2)
+
+        print(f"\n{'='*70}")
+        print(f"CORPUS '{self.name}' CONCLUÍDO")
+        print(f"{'='*70}")
+        print(f"Total de notícias processadas: {self.processed}")
+        if self.skipped > 0:
+            print(f"Notícias puladas (já processadas): {self.skipped}")
+        if self.cache_hits > 0:
+            print(f"♻️  Respostas reaproveitadas do cache: {self.cache_hits}")
+        if self.timeouts > 0:
+            print(f"⏱️  Notícias com timeout: {self.timeouts}")
+        if self.failures > 0:
+            print(f"⚠ Notícias com erro na análise: {self.failures}")
+        if self.parse_failures > 0:
+            print(f"⚠ Respostas com JSON inválido (registradas como sem fraude): {self.parse_failures}")
+        print(f"Notícias relacionadas a fraudes: {len(self.fraud_news)}")
+        print(f"Notícias com empresas identificadas: {len(self.fraud_news_with_companies)}")
+        print_execution_metrics(metrics_data["execution_metrics"])
+        print(f"\nResultados JSON: {self.output_file}")
+        print(f"CSV: {self.csv_file}")
+        print(f"Métricas: {self.metrics_file}")
+        print(f"{'='*70}\n")
+
+
+def article_date(news_data: Dict, date_fields: tuple = DATE_FIELDS) -> Optional[str]:
+    """
+    Data da notícia em AAAA-MM-DD, a partir do primeiro campo de date_fields que
+    contenha uma data ISO (2024-03-15, 2024-03-15T10:00) ou brasileira (15/03/2024).
+    """
+    for field in date_fields:
+        value = str(news_data.get(field) or "")
+        match = re.search(r"(\d{4})-(\d{2})-(\d{2})", value)
+        if match:
+            return "-".join(match.groups())
+        match = re.search(r"(\d{2})/(\d{2})/(\d{4})", value)
+        if match:
+            day, month, year = match.groups()
+            return f"{year}-{month}-{day}"
+    return None
+
+
+def _read_article_date(json_file: Path, date_fields: tuple) -> Optional[str]:
+    try:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return article_date(json.load(f), date_fields)
+    except Exception:
+        return None
+
+
+class JobRunner:
+    """
+    Distribui as notícias de vários corpora por um único pool de workers,
+    em rodízio entre os corpora que ainda têm notícias pendentes.
+    """
+
+    def __init__(self, corpora: List[Corpus], cache: ResultCache,
+                 workers: int = DEFAULT_WORKERS, priority: Optional[set] = None,
+                 priority_since: Optional[str] = None, date_fields: tuple = DATE_FIELDS):
+        self.corpora = corpora
+        self.cache = cache
+        self.workers = workers
+        self.detector = FraudDetector()
+        self._next_corpus = 0
+
+        self.cost_model = self._build_cost_model()
+        for corpus in self.corpora:
+            corpus.schedule(self.cost_model, corpus.name in (priority or set()), priority_since, date_fields)
+        self.progress = ProgressTracker(
+            sum(len(corpus.pending) for corpus in self.corpora),
+            sum(corpus.pending_cost() for corpus in self.corpora)
+        )
+
+    def _build_cost_model(self) -> CostModel:
+        """Ajusta o CostModel com as latências já conhecidas (cache e resultados anteriores)."""
+        cost_model = CostModel()
+        input_paths = {corpus.name: corpus.input_path for corpus in self.corpora}
+        samples = {}  # Por (corpus, arquivo): a mesma notícia no cache e nos resultados conta uma vez
+        for corpus in self.corpora:
+            for file_name, file_size, seconds in corpus.history():
+                samples[(corpus.name, file_name)] = (file_size, seconds)
+        for record in self.cache.records():
+            file_size = record.get('file_size', 0)
+            if not file_size and record['corpus'] in input_paths:
+                try:
+                    file_size = (input_paths[record['corpus']] / record['file']).stat().st_size
+                except OSError:
+                    continue
+            samples[(record['corpus'], record['file'])] = (file_size, record['analysis'].get('execution_time_seconds', 0))
+        for file_size, seconds in samples.values():
+            cost_model.add(file_size, seconds)
+        cost_model.fit()
+        return cost_model
+
+    def _next_job(self) -> Optional[tuple]:
+        """
+        Próxima notícia a despachar: entre os corpora cuja próxima notícia tem a maior
+        prioridade, alterna em rodízio (round-robin); dentro do corpus, a mais curta.
+        """
+        heads = [corpus.pending[0][0] for corpus in self.corpora if corpus.pending]
+        if not heads:
+            return None
+        best_tier = min(heads)
+        for offset in range(len(self.corpora)):
+            corpus = self.corpora[(self._next_corpus + offset) % len(self.corpora)]
+            if corpus.pending and corpus.pending[0][0] == best_tier:
+                self._next_corpus = (self._next_corpus + offset + 1) % len(self.corpora)
+                _, estimated_cost, _, json_file = heapq.heappop(corpus.pending)
+                return corpus, json_file, estimated_cost
+        return None
+
+    def _complete(self, corpus: Corpus, json_file: Path, title: str, url: str, text: str,
+                  fingerprint: str, result: Dict, estimated_cost: float, raw_response: Optional[str] = None,
+                  from_cache: bool = False):
+        if from_cache:
+            corpus.cache_hits += 1
+        elif raw_response is not None:
+            self.cache.put(fingerprint, corpus.name, json_file.name, result, raw_response,
+                           title, url, json_file.stat().st_size)
+        self._progress(estimated_cost, analyzed=not from_cache)
+        if is_transient_failure(result):
+            corpus.record_failure(json_file, result)
+            return
+        if result.get('error') == "json_decode":
+            # Registrada como sem fraude e com checkpoint, como no main.py
+            corpus.parse_failures += 1
+        corpus.record(json_file, title, url, text, result)
+        if corpus.processed % SAVE_INTERVAL == 0:
+            corpus.save()
+            print(f"💾 [{corpus.name}] Salvamento automático: {len(corpus.fraud_news)} fraudes, "
+                  f"{len(corpus.fraud_news_with_companies)} com empresas")
+
+    def _progress(self, estimated_cost: float, analyzed: bool = True):
+        self.progress.done(estimated_cost, analyzed)
+        if self.progress.completed % PROGRESS_INTERVAL == 0:
+            print(self.progress.report())
+
+    def run(self):
+        print(f"\n{'='*70}")
+        print(f"Iniciando processamento de {len(self.corpora)} corpora com {self.workers} workers")
+        for corpus in self.corpora:
+            print(f"  - {corpus.name}: {len(corpus.pending)} pendentes de {corpus.total_files} "
+                  f"({corpus.skipped} já processadas)")
+        print(f"♻️  Cache de resultados: {len(self.cache)} respostas")
+        if self.cost_model.samples:
+            serial_eta = self.progress.remaining_cost / self.workers
+            print(f"📐 Modelo de latência: {self.cost_model.intercept:.2f}s + {self.cost_model.slope * 1000:.3f}s/KB "
+                  f"({self.cost_model.samples} amostras) - estimativa inicial: {_format_duration(serial_eta)}")
+        print(f"⏱️  Timeout: {TIMEOUT_SECONDS}s por notícia")
+        print(f"{'='*70}\n")
+
+        consecutive_403_errors = 0
+        in_flight = {}
+        abandoned = set()  # Requisições que passaram do prazo mas ainda ocupam um worker
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                # Manter no máximo `workers` notícias em voo, alternando entre corpora
+                abandoned = {future for future in abandoned if not future.done()}
+                while len(in_flight) + len(abandoned) < self.workers:
+                    job = self._next_job()
+                    if job is None:
+                        break
+                    corpus, json_file, estimated_cost = job
+                    try:
+                        with open(json_file, 'r', encoding='utf-8') as f:
+                            news_data = json.load(f)
+                    except Exception as e:
+                        print(f"  ✗ ERRO ao ler {json_file.name}: {e}")
+                        self._progress(estimated_cost, analyzed=False)
+                        continue
+                    title = news_data.get("title", "")
+                    text = news_data.get("text", "")
+                    url = news_data.get("url", "")
+
+                    fingerprint = self.detector.request_fingerprint(text, title)
+                    cached = self.cache.get(fingerprint)
+                    if cached is not None:
+                        self._complete(corpus, json_file, title, url, text, fingerprint, cached,
+                                       estimated_cost, from_cache=True)
+                        continue
+
+                    future = pool.submit(self.detector.analyze_fraud_with_response, text, title, TIMEOUT_SECONDS)
+                    in_flight[future] = (corpus, json_file, title, url, text, fingerprint, estimated_cost, time.time())
+
+                if not in_flight:
+                    if abandoned:
+                        wait(abandoned, return_when=FIRST_COMPLETED)
+                        continue
+                    break
+
+                # SIGALRM não funciona nas threads: o prazo de TIMEOUT_SECONDS é aplicado aqui
+                next_deadline = min(job[-1] for job in in_flight.values()) + TIMEOUT_SECONDS
+                done, _ = wait(in_flight, timeout=max(next_deadline - time.time(), 0),
+                               return_when=FIRST_COMPLETED)
+                now = time.time()
+                for future, job in list(in_flight.items()):
+                    if future not in done and now - job[-1] >= TIMEOUT_SECONDS:
+                        del in_flight[future]
+                        abandoned.add(future)
+                        corpus, json_file, title, url, text, fingerprint, estimated_cost, started = job
+                        print(f"[⏱️ TIMEOUT] {json_file.name} excedeu {TIMEOUT_SECONDS}s - pulando notícia")
+                        result = dict(default_analysis(), execution_time_seconds=round(now - started, 2), error="timeout")
+                        self._complete(corpus, json_file, title, url, text, fingerprint, result, estimated_cost)
+                for future in done:
+                    corpus, json_file, title, url, text, fingerprint, estimated_cost, _ = in_flight.pop(future)
+                    try:
+                        raw_response, result = future.result()
+                        consecutive_403_errors = 0
+                    except OllamaError403:
+                        consecutive_403_errors += 1
+                        print(f"⚠️  Erro 403 consecutivo #{consecutive_403_errors}/{MAX_CONSECUTIVE_403_ERRORS}")
+                        self._progress(estimated_cost)
+                        continue
+                    except Exception as e:
+                        print(f"  ✗ ERRO ao processar {json_file.name}: {e}")
+                        self._progress(estimated_cost)
+                        continue
+                    self._complete(corpus, json_file, title, url, text, fingerprint, result, estimated_cost,
+                                   raw_response=raw_response)
+
+                if consecutive_403_errors >= MAX_CONSECUTIVE_403_ERRORS:
+                    for future in in_flight:
+                        future.cancel()
+                    print(f"\n{'='*70}")
+                    print(f"🛑 INTERROMPENDO PROCESSAMENTO")
+                    print(f"   Motivo: {MAX_CONSECUTIVE_403_ERRORS} erros 403 consecutivos do Ollama")
+                    print(f"{'='*70}\n")
+                    for corpus in self.corpora:
+                        corpus.save(stopped_reason=f"Múltiplos erros 403 consecutivos ({MAX_CONSECUTIVE_403_ERRORS})")
+                    print("💾 Progresso salvo antes de parar.")
+                    return
+
+        for corpus in self.corpora:
+            corpus.finalize()
+
+
+def _parse_named(values: List[str], option: str) -> Dict[str, str]:
+    """Converte argumentos NOME=VALOR em dicionário."""
+    parsed = {}
+    for value in values or []:
+        name, sep, rest = value.partition("=")
+        if not sep or not name or not rest:
+            raise ValueError(f"{option} espera NOME=VALOR, recebido: {value}")
+        parsed[name] = rest
+    return parsed
+
+
+def _parse_since(value: str) -> str:
+    """Valida a data de --priority-since e a normaliza para AAAA-MM-DD (comparável com article_date)."""
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"--priority-since espera uma data AAAA-MM-DD, recebido: {value}") from None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detector de fraudes sobre vários corpora com pool e cache compartilhados")
+    parser.add_argument("--corpus", action="append", required=True, metavar="NOME=PASTA",
+                        help="Corpus a processar (pode ser repetido)")
+    parser.add_argument("--output-dir", default=".", help="Pasta dos arquivos de saída de cada corpus")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Requisições simultâneas ao Ollama (compartilhadas entre os corpora)")
+    parser.add_argument("--cache-file", default=DEFAULT_CACHE_FILE, help="Cache de resultados (JSONL)")
+    parser.add_argument("--checkpoint-file", default=DEFAULT_CHECKPOINT_FILE, help="Checkpoints (JSONL)")
+    parser.add_argument("--start-from", action="append", metavar="NOME=N",
+                        help="Começar o corpus NOME da notícia N (pula as anteriores)")
+    parser.add_argument("--priority", action="append", default=[], metavar="NOME",
+                        help="Corpus processado antes dos demais (pode ser repetido)")
+    parser.add_argument("--priority-since", metavar="AAAA-MM-DD",
+                        help="Priorizar notícias com data a partir desta (lê todos os JSONs pendentes)")
+    parser.add_argument("--date-field", action="append", metavar="CAMPO",
+                        help=f"Campo de data dos JSONs para --priority-since (padrão: {', '.join(DATE_FIELDS)})")
+    args = parser.parse_args()
+
+    priority_since = None
+    if args.priority_since:
+        try:
+            priority_since = _parse_since(args.priority_since)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.workers < 1:
+        parser.error(f"--workers deve ser pelo menos 1, recebido: {args.workers}")
+    try:
+        corpus_dirs = _parse_named(args.corpus, "--corpus")
+        start_from = _parse_named(args.start_from, "--start-from")
+    except ValueError as e:
+        parser.error(str(e))
+    for name, n in start_from.items():
+        if not n.isdigit():
+            parser.error(f"--start-from espera NOME=N com N inteiro, recebido: {name}={n}")
+        start_from[name] = int(n)
+    unknown = sorted((set(start_from) | set(args.priority)) - set(corpus_dirs))
+    if unknown:
+        parser.error(f"Corpus não informado em --corpus: {', '.join(unknown)}")
+
+    print("\n" + "="*70)
+    print("DETECTOR DE FRAUDES EMPRESARIAIS - MÚLTIPLOS CORPORA")
+    print("="*70)
+    for name, input_dir in corpus_dirs.items():
+        print(f"Corpus {name}: {input_dir}")
+    print(f"Pasta de saída: {args.output_dir}")
+    print(f"Cache: {args.cache_file}")
+    print(f"Checkpoints: {args.checkpoint_file}")
+    print(f"Modelo: {SELECTED_MODEL}")
+    print("="*70 + "\n")
+
+    cache = ResultCache(args.cache_file)
+    checkpoints = CheckpointStore(args.checkpoint_file)
+    corpora = []
+    for name, input_dir in corpus_dirs.items():
+        corpus = Corpus(name, input_dir, args.output_dir)
+        if corpus.load(checkpoints, start_from.get(name, 0)):
+            corpora.append(corpus)
+
+    try:
+        if corpora:
+            JobRunner(corpora, cache, workers=args.workers,
+                      priority=set(args.priority), priority_since=priority_since,
+                      date_fields=tuple(args.date_field or DATE_FIELDS)).run()
+    finally:
+        cache.close()
+        checkpoints.close()
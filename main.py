@@ -3,8 +3,11 @@ import json
 import csv
 import time
 import signal
+import hashlib
+import argparse
+import threading
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from langchain_core.messages import HumanMessage
 from langchain_ollama import ChatOllama
@@ -15,6 +18,7 @@ LLM_TEMPERATURE = 0
 TIMEOUT_SECONDS = 180  # Timeout de 180 segundos por notícia
 START_FROM = 108518  # Última processada: 108517 (12/fev/2026 18:42) - Retomar daqui
 MAX_CONSECUTIVE_403_ERRORS = 5  # Parar após 5 erros 403 consecutivos
+DEFAULT_CACHE_FILE = "result_cache.jsonl"  # Respostas brutas do LLM (usadas pelo replay.py)
 
 class TimeoutError(Exception):
     """Exceção lançada quando o processamento excede o timeout"""
@@ -28,63 +32,68 @@ def timeout_handler(signum, frame):
     """Handler para timeout"""
     raise TimeoutError("Processamento excedeu o tempo limite")
 
+def is_timeout_error(error: Exception) -> bool:
+    """Timeouts do cliente HTTP do Ollama (httpx.ReadTimeout, ConnectTimeout, ...)."""
+    return any("Timeout" in cls.__name__ for cls in type(error).__mro__)
+
+def is_transient_failure(analysis: Dict) -> bool:
+    """
+    Falha que vale a pena tentar de novo (timeout, erro de conexão). Respostas que não
+    puderam ser interpretadas (error="json_decode") são resultado definitivo do modelo:
+    ficam registradas como sem fraude, como o main.py sempre fez.
+    """
+    return "error" in analysis and analysis["error"] != "json_decode"
+
+def default_analysis() -> Dict:
+    """Resultado padrão (sem fraude) usado quando a análise falha ou não se aplica."""
+    return {
+        "is_fraud_related": False,
+        "confidence": "baixa",
+        "fraud_types": [],
+        "companies_involved": [],
+        "people_involved": [],
+        "execution_time_seconds": 0.0
+    }
+
 class FraudDetector:
     def __init__(self):
         print(f"Fraud Detector configurado para usar Ollama em {OLLAMA_HOST} (modelo: {SELECTED_MODEL})")
         self.llm = None
         self._llm_initialized = False
+        self._llm_lock = threading.Lock()
     
     def _ensure_llm(self):
-        if not self._llm_initialized:
-            print(f"Conectando ao Ollama em {OLLAMA_HOST}...")
-            try:
-                self.llm = ChatOllama(
-                    model=SELECTED_MODEL,
-                    base_url=OLLAMA_HOST,
-                    temperature=LLM_TEMPERATURE,
-                    timeout=120
-                )
-                self._llm_initialized = True
-                print("Conexão com Ollama estabelecida com sucesso!")
-            except Exception as e:
-                print(f"ERRO ao conectar ao Ollama: {e}")
-                self.llm = None
-                self._llm_initialized = True
-
-    def analyze_fraud(self, text: str, title: str, timeout: int = TIMEOUT_SECONDS) -> Dict:
+        # Lock necessário quando o detector é compartilhado entre threads (job_runner.py)
+        with self._llm_lock:
+            if not self._llm_initialized:
+                print(f"Conectando ao Ollama em {OLLAMA_HOST}...")
+                try:
+                    self.llm = ChatOllama(
+                        model=SELECTED_MODEL,
+                        base_url=OLLAMA_HOST,
+                        temperature=LLM_TEMPERATURE,
+                        timeout=120
+                    )
+                    self._llm_initialized = True
+                    print("Conexão com Ollama estabelecida com sucesso!")
+                except Exception as e:
+                    print(f"ERRO ao conectar ao Ollama: {e}")
+                    self.llm = None
+                    self._llm_initialized = True
+
+    def request_fingerprint(self, text: str, title: str) -> str:
         """
-        Analisa se a notícia trata de fraudes envolvendo empresas.
-        
-        Retorna:
-        {
-            "is_fraud_related": bool,
-            "confidence": str,  # "alta", "média", "baixa"
-            "fraud_types": List[str],
-            "companies_involved": List[str],
-            "summary": str
-        }
+        Impressão digital da requisição ao LLM (modelo, temperatura e prompt completo).
+        Usada como chave do cache de resultados: mudar o prompt ou o modelo invalida o cache.
         """
-        default_return = {
-            "is_fraud_related": False,
-            "confidence": "baixa",
-            "fraud_types": [],
-            "companies_involved": [],
-            "people_involved": [],
-            "execution_time_seconds": 0.0
-        }
-        
-        self._ensure_llm()
-        
-        if not self.llm:
-            print("Erro: LLM não inicializado.")
-            return default_return
-        
-        if not text or not isinstance(text, str):
-            return default_return
+        payload = f"{SELECTED_MODEL}\n{LLM_TEMPERATURE}\n{self.build_prompt(text, title)}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
 
+    def build_prompt(self, text: str, title: str) -> str:
+        """Monta o prompt de análise de fraude para a notícia."""
         full_text = f"{title}\n\n{text}" if title else text
         
-        prompt_content = f"""
+        return f"""
 Você é um especialista em análise de notícias sobre fraudes empresariais e crimes contra a administração pública.
 
 Sua tarefa é analisar a notícia fornecida e determinar se ela trata de fraudes envolvendo empresas.
@@ -172,37 +181,83 @@ Texto da notícia:
 Responda APENAS com o JSON válido, sem texto adicional.
 """
 
+    def analyze_fraud(self, text: str, title: str, timeout: int = TIMEOUT_SECONDS) -> Dict:
+        """
+        Analisa se a notícia trata de fraudes envolvendo empresas.
+        
+        Retorna:
+        {
+            "is_fraud_related": bool,
+            "confidence": str,  # "alta", "média", "baixa"
+            "fraud_types": List[str],
+            "companies_involved": List[str],
+            "summary": str
+        }
+        """
+        return self.analyze_fraud_with_response(text, title, timeout)[1]
+
+    def analyze_fraud_with_response(self, text: str, title: str, timeout: int = TIMEOUT_SECONDS) -> Tuple[Optional[str], Dict]:
+        """
+        Igual a analyze_fraud, mas retorna também a resposta bruta do modelo
+        (None quando não houve resposta: timeout, erro ou LLM indisponível).
+        A resposta bruta é guardada no cache do job_runner.py para o replay.py.
+        """
+        default_return = default_analysis()
+        
+        self._ensure_llm()
+        
+        if not self.llm:
+            print("Erro: LLM não inicializado.")
+            return None, default_return
+        
+        if not text or not isinstance(text, str):
+            return None, default_return
+
+        prompt_content = self.build_prompt(text, title)
+
         start_time = time.time()
         
-        # Configurar timeout
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
+        # Configurar timeout (SIGALRM só funciona na thread principal; nas threads
+        # do job_runner.py vale o timeout do próprio cliente ChatOllama)
+        use_alarm = threading.current_thread() is threading.main_thread()
+        if use_alarm:
+            signal.signal(signal.SIGALRM, timeout_handler)
+            signal.alarm(timeout)
         
         try:
             response = self.llm.invoke([HumanMessage(content=prompt_content)])
-            signal.alarm(0)  # Cancelar timeout se completou
+            if use_alarm:
+                signal.alarm(0)  # Cancelar timeout se completou
             result = response.content.strip()
             parsed_result = self._parse_json_response(result, default_return)
             execution_time = time.time() - start_time
             parsed_result["execution_time_seconds"] = round(execution_time, 2)
-            return parsed_result
+            return result, parsed_result
         except TimeoutError:
-            signal.alarm(0)  # Cancelar timeout
+            if use_alarm:
+                signal.alarm(0)  # Cancelar timeout
             print(f"[⏱️ TIMEOUT] Processamento excedeu {timeout}s - pulando notícia")
             execution_time = time.time() - start_time
             default_return["execution_time_seconds"] = round(execution_time, 2)
-            return default_return
+            default_return["error"] = "timeout"
+            return None, default_return
         except Exception as e:
-            signal.alarm(0)  # Cancelar timeout
+            if use_alarm:
+                signal.alarm(0)  # Cancelar timeout
             error_msg = str(e)
             # Verificar se é erro 403
             if "403" in error_msg or "Forbidden" in error_msg:
                 print(f"[❌ ERRO 403] Ollama retornou erro de permissão: {error_msg}")
                 raise OllamaError403(f"Erro 403 do Ollama: {error_msg}")
-            print(f"[Erro na Análise] {e}")
             execution_time = time.time() - start_time
             default_return["execution_time_seconds"] = round(execution_time, 2)
-            return default_return
+            if is_timeout_error(e):
+                print(f"[⏱️ TIMEOUT] Cliente do Ollama excedeu o tempo limite ({error_msg}) - pulando notícia")
+                default_return["error"] = "timeout"
+            else:
+                print(f"[Erro na Análise] {e}")
+                default_return["error"] = error_msg
+            return None, default_return
 
     def _parse_json_response(self, result_str: str, default_return: Dict) -> Dict:
         if result_str.startswith("```json"):
@@ -246,7 +301,98 @@ Responda APENAS com o JSON válido, sem texto adicional.
             return out
         except json.JSONDecodeError:
             print(f"Falha ao decodificar JSON. Início da resposta: {result_str[:50]}...")
-            return default_return
+            return dict(default_return, error="json_decode")
+
+
+def build_csv_row(file_name: str, title: str, url: str, text: str, analysis: Dict) -> Dict:
+    """
+    Monta a linha do CSV de notícias com empresas a partir do resultado da análise.
+    """
+    return {
+        "file": file_name,
+        "title": title,
+        "url": url,
+        "text": text,
+        "companies": '; '.join(analysis['companies_involved']),
+        "people": '; '.join(analysis.get('people_involved', [])),
+        "fraud_types": '; '.join(analysis.get('fraud_types', [])),
+        "confidence": analysis.get('confidence', ''),
+        "execution_time_seconds": analysis.get('execution_time_seconds', 0)
+    }
+
+
+def postprocess(file_name: str, title: str, url: str, text: str, analysis: Dict) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Etapa pós-LLM comum a main.py, job_runner.py e replay.py: decide se a notícia
+    entra no JSON de resultados (fraude) e no CSV (fraude com empresas).
+    Retorna (entrada do JSON ou None, linha do CSV ou None).
+    """
+    if not analysis["is_fraud_related"]:
+        return None, None
+    fraud_entry = {
+        "file": file_name,
+        "title": title,
+        "url": url,
+        "analysis": analysis
+    }
+    csv_row = build_csv_row(file_name, title, url, text, analysis) if analysis['companies_involved'] else None
+    return fraud_entry, csv_row
+
+
+class ResultCache:
+    """
+    Cache de análises do LLM em JSONL (uma linha por requisição), indexado pela
+    impressão digital da requisição. Guarda a resposta bruta do modelo junto com a
+    análise, para que o replay.py possa reprocessá-la sem chamar o LLM. Respostas
+    que não puderam ser interpretadas também são reaproveitadas (a mesma requisição
+    tende a gerar o mesmo JSON inválido); só falhas transitórias não são.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Linha truncada (processo interrompido no meio da escrita)
+                    self._entries[record['fingerprint']] = record
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        record = self._entries.get(fingerprint)
+        if not record or is_transient_failure(record['analysis']):
+            return None
+        return dict(record['analysis'])
+
+    def records(self) -> List[Dict]:
+        return list(self._entries.values())
+
+    def put(self, fingerprint: str, corpus: str, file_name: str, analysis: Dict, raw_response: str,
+            title: str = "", url: str = "", file_size: int = 0):
+        record = {
+            "fingerprint": fingerprint,
+            "corpus": corpus,
+            "file": file_name,
+            "title": title,
+            "url": url,
+            "file_size": file_size,
+            "raw_response": raw_response,
+            "analysis": analysis
+        }
+        with self._lock:
+            self._entries[fingerprint] = record
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
 
 
 def save_csv_incremental(csv_file: str, fraud_news_with_companies: list):
@@ -262,6 +408,75 @@ def save_csv_incremental(csv_file: str, fraud_news_with_companies: list):
             writer.writerows(fraud_news_with_companies)
 
 
+def save_results_json(output_file: str, processed: int, fraud_news: list, fraud_news_with_companies: list, **extra):
+    """
+    Salva o JSON de resultados (notícias de fraude) com os totais atuais.
+    Campos extras (ex.: stopped_reason, last_file) são incluídos antes da lista de notícias.
+    """
+    output_path = Path(output_file)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "total_processed": processed,
+            "total_fraud_related": len(fraud_news),
+            "total_with_companies": len(fraud_news_with_companies),
+            **extra,
+            "fraud_news": fraud_news
+        }, f, ensure_ascii=False, indent=2)
+
+
+def build_metrics_data(processed: int, fraud_news: list, fraud_news_with_companies: list) -> Dict:
+    """
+    Monta o dicionário de métricas de performance a partir dos resultados.
+    """
+    all_execution_times = [entry['analysis'].get('execution_time_seconds', 0) for entry in fraud_news]
+    total_execution_time = sum(all_execution_times)
+    avg_execution_time = total_execution_time / len(all_execution_times) if all_execution_times else 0
+    min_execution_time = min(all_execution_times) if all_execution_times else 0
+    max_execution_time = max(all_execution_times) if all_execution_times else 0
+    
+    sorted_times = sorted(all_execution_times)
+    median_execution_time = sorted_times[len(sorted_times)//2] if sorted_times else 0
+    
+    return {
+        "model": SELECTED_MODEL,
+        "ollama_host": OLLAMA_HOST,
+        "temperature": LLM_TEMPERATURE,
+        "timestamp": datetime.now().isoformat(),
+        "processing_summary": {
+            "total_news_processed": processed,
+            "total_fraud_detected": len(fraud_news),
+            "total_with_companies_or_people": len(fraud_news_with_companies),
+            "fraud_detection_rate": round(len(fraud_news) / processed * 100, 2) if processed > 0 else 0,
+            "companies_people_identification_rate": round(len(fraud_news_with_companies) / len(fraud_news) * 100, 2) if fraud_news else 0
+        },
+        "execution_metrics": {
+            "total_time_seconds": round(total_execution_time, 2),
+            "total_time_minutes": round(total_execution_time / 60, 2),
+            "average_time_per_news": round(avg_execution_time, 2),
+            "min_time_seconds": round(min_execution_time, 2),
+            "max_time_seconds": round(max_execution_time, 2),
+            "median_time_seconds": round(median_execution_time, 2)
+        },
+        "confidence_distribution": {
+            "alta": sum(1 for entry in fraud_news if entry['analysis'].get('confidence') == 'alta'),
+            "média": sum(1 for entry in fraud_news if entry['analysis'].get('confidence') == 'média'),
+            "baixa": sum(1 for entry in fraud_news if entry['analysis'].get('confidence') == 'baixa')
+        }
+    }
+
+
+def print_execution_metrics(execution_metrics: Dict):
+    """
+    Imprime o bloco de métricas de performance no console.
+    """
+    print(f"\nMétricas de Performance:")
+    print(f"  Tempo total: {execution_metrics['total_time_seconds']:.2f}s ({execution_metrics['total_time_minutes']:.2f} min)")
+    print(f"  Tempo médio por notícia: {execution_metrics['average_time_per_news']:.2f}s")
+    print(f"  Tempo mínimo: {execution_metrics['min_time_seconds']:.2f}s")
+    print(f"  Tempo máximo: {execution_metrics['max_time_seconds']:.2f}s")
+    print(f"  Tempo mediano: {execution_metrics['median_time_seconds']:.2f}s")
+
+
 def get_already_processed_files(output_file: str) -> set:
     """
     Retorna conjunto de arquivos já processados do JSON parcial.
@@ -279,13 +494,16 @@ def get_already_processed_files(output_file: str) -> set:
         return set()
 
 
-def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_file: str, resume: bool = True):
+def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_file: str, resume: bool = True,
+                     cache_file: str = DEFAULT_CACHE_FILE):
     """
     Processa todas as notícias na pasta e identifica aquelas relacionadas a fraudes.
     Gera um CSV com apenas as notícias que têm empresas envolvidas em fraudes.
     Gera um arquivo de métricas de performance separado.
     Salva incrementalmente a cada 25 notícias processadas.
     Inclui timeout de 60s por notícia para evitar travamentos.
+    Guarda as respostas brutas do LLM no cache (cache_file) para o replay.py,
+    usando o nome da pasta de entrada como nome do corpus.
     """
     detector = FraudDetector()
     input_path = Path(input_dir)
@@ -294,6 +512,16 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
         print(f"ERRO: Diretório {input_dir} não encontrado!")
         return
     
+    cache = ResultCache(cache_file)
+    try:
+        _process_all_news(detector, cache, input_path, output_file, csv_file, metrics_file, resume)
+    finally:
+        cache.close()
+
+
+def _process_all_news(detector: FraudDetector, cache: ResultCache, input_path: Path, output_file: str,
+                      csv_file: str, metrics_file: str, resume: bool):
+    
     json_files = sorted(list(input_path.glob("*.json")))
     total_files = len(json_files)
     
@@ -312,17 +540,10 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
             for entry in fraud_news:
                 analysis = entry.get('analysis', {})
                 if analysis.get('companies_involved'):
-                    fraud_news_with_companies.append({
-                        'file': entry['file'],
-                        'title': entry['title'],
-                        'url': entry['url'],
-                        'text': '',  # Será preenchido depois se necessário
-                        'companies': '; '.join(analysis['companies_involved']),
-                        'people': '; '.join(analysis.get('people_involved', [])),
-                        'fraud_types': '; '.join(analysis.get('fraud_types', [])),
-                        'confidence': analysis.get('confidence', ''),
-                        'execution_time_seconds': analysis.get('execution_time_seconds', 0)
-                    })
+                    # text vazio: será preenchido depois se necessário
+                    fraud_news_with_companies.append(
+                        build_csv_row(entry['file'], entry['title'], entry['url'], '', analysis)
+                    )
             print(f"\n📂 RETOMANDO PROCESSAMENTO")
             print(f"   Já processadas: {len(already_processed)} notícias")
             print(f"   Fraudes detectadas anteriormente: {len(fraud_news)}")
@@ -373,9 +594,12 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
             print(f"[{news_number}/{total_files}] Processando: {json_file.name}...")
             
             try:
-                result = detector.analyze_fraud(text, title, timeout=TIMEOUT_SECONDS)
+                raw_response, result = detector.analyze_fraud_with_response(text, title, timeout=TIMEOUT_SECONDS)
                 # Resetar contador de 403 em caso de sucesso
                 consecutive_403_errors = 0
+                if raw_response is not None:
+                    cache.put(detector.request_fingerprint(text, title), input_path.name, json_file.name,
+                              result, raw_response, title, url, json_file.stat().st_size)
             except OllamaError403 as e403:
                 consecutive_403_errors += 1
                 print(f"⚠️  Erro 403 consecutivo #{consecutive_403_errors}/{MAX_CONSECUTIVE_403_ERRORS}")
@@ -389,16 +613,11 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
                     print(f"{'='*70}\n")
                     
                     # Salvar progresso antes de parar
-                    output_path = Path(output_file)
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump({
-                            "total_processed": processed,
-                            "total_fraud_related": len(fraud_news),
-                            "total_with_companies": len(fraud_news_with_companies),
-                            "stopped_reason": f"Múltiplos erros 403 consecutivos ({MAX_CONSECUTIVE_403_ERRORS})",
-                            "last_file": json_file.name,
-                            "fraud_news": fraud_news
-                        }, f, ensure_ascii=False, indent=2)
+                    save_results_json(
+                        output_file, processed, fraud_news, fraud_news_with_companies,
+                        stopped_reason=f"Múltiplos erros 403 consecutivos ({MAX_CONSECUTIVE_403_ERRORS})",
+                        last_file=json_file.name
+                    )
                     save_csv_incremental(csv_file, fraud_news_with_companies)
                     print("💾 Progresso salvo antes de parar.")
                     return  # Parar processamento
@@ -410,13 +629,8 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
             if result.get('execution_time_seconds', 0) >= TIMEOUT_SECONDS - 1:
                 timeouts += 1
             
-            if result["is_fraud_related"]:
-                fraud_entry = {
-                    "file": json_file.name,
-                    "title": title,
-                    "url": url,
-                    "analysis": result
-                }
+            fraud_entry, csv_row = postprocess(json_file.name, title, url, text, result)
+            if fraud_entry:
                 fraud_news.append(fraud_entry)
                 
                 print(f"  ✓ FRAUDE DETECTADA (confiança: {result['confidence']}) - Tempo: {result.get('execution_time_seconds', 0)}s")
@@ -426,18 +640,8 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
                 if result['people_involved']:
                     print(f"    Pessoas: {', '.join(result['people_involved'])}")
                 
-                if result['companies_involved']:
-                    fraud_news_with_companies.append({
-                        "file": json_file.name,
-                        "title": title,
-                        "url": url,
-                        "text": text,
-                        "companies": '; '.join(result['companies_involved']),
-                        "people": '; '.join(result['people_involved']) if result['people_involved'] else '',
-                        "fraud_types": '; '.join(result['fraud_types']),
-                        "confidence": result['confidence'],
-                        "execution_time_seconds": result.get('execution_time_seconds', 0)
-                    })
+                if csv_row:
+                    fraud_news_with_companies.append(csv_row)
                     if result['people_involved']:
                         print(f"    💰 BÔNUS: Pessoas também identificadas!")
                 else:
@@ -459,14 +663,7 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
             print(f"{'='*70}")
             
             # Salvar JSON parcial
-            output_path = Path(output_file)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "total_processed": processed,
-                    "total_fraud_related": len(fraud_news),
-                    "total_with_companies": len(fraud_news_with_companies),
-                    "fraud_news": fraud_news
-                }, f, ensure_ascii=False, indent=2)
+            save_results_json(output_file, processed, fraud_news, fraud_news_with_companies)
             
             # Salvar CSV parcial
             save_csv_incremental(csv_file, fraud_news_with_companies)
@@ -477,14 +674,8 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
         
         print()
     
-    all_execution_times = [entry['analysis'].get('execution_time_seconds', 0) for entry in fraud_news]
-    total_execution_time = sum(all_execution_times)
-    avg_execution_time = total_execution_time / len(all_execution_times) if all_execution_times else 0
-    min_execution_time = min(all_execution_times) if all_execution_times else 0
-    max_execution_time = max(all_execution_times) if all_execution_times else 0
-    
-    sorted_times = sorted(all_execution_times)
-    median_execution_time = sorted_times[len(sorted_times)//2] if sorted_times else 0
+    metrics_data = build_metrics_data(processed, fraud_news, fraud_news_with_companies)
+    execution_metrics = metrics_data["execution_metrics"]
     
     print(f"\n{'='*70}")
     print(f"PROCESSAMENTO CONCLUÍDO")
@@ -496,68 +687,25 @@ def process_all_news(input_dir: str, output_file: str, csv_file: str, metrics_fi
         print(f"⏱️  Notícias com timeout: {timeouts}")
     print(f"Notícias relacionadas a fraudes: {len(fraud_news)}")
     print(f"Notícias com empresas/pessoas identificadas: {len(fraud_news_with_companies)}")
-    print(f"\nMétricas de Performance:")
-    print(f"  Tempo total: {total_execution_time:.2f}s ({total_execution_time/60:.2f} min)")
-    print(f"  Tempo médio por notícia: {avg_execution_time:.2f}s")
-    print(f"  Tempo mínimo: {min_execution_time:.2f}s")
-    print(f"  Tempo máximo: {max_execution_time:.2f}s")
-    print(f"  Tempo mediano: {median_execution_time:.2f}s")
+    print_execution_metrics(execution_metrics)
     print(f"{'='*70}\n")
     
-    output_path = Path(output_file)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            "total_processed": processed,
-            "total_fraud_related": len(fraud_news),
-            "total_with_companies": len(fraud_news_with_companies),
-            "fraud_news": fraud_news
-        }, f, ensure_ascii=False, indent=2)
+    save_results_json(output_file, processed, fraud_news, fraud_news_with_companies)
     
     print(f"Resultados JSON salvos em: {output_file}")
     
-    metrics_data = {
-        "model": SELECTED_MODEL,
-        "ollama_host": OLLAMA_HOST,
-        "temperature": LLM_TEMPERATURE,
-        "timestamp": datetime.now().isoformat(),
-        "processing_summary": {
-            "total_news_processed": processed,
-            "total_fraud_detected": len(fraud_news),
-            "total_with_companies_or_people": len(fraud_news_with_companies),
-            "fraud_detection_rate": round(len(fraud_news) / processed * 100, 2) if processed > 0 else 0,
-            "companies_people_identification_rate": round(len(fraud_news_with_companies) / len(fraud_news) * 100, 2) if fraud_news else 0
-        },
-        "execution_metrics": {
-            "total_time_seconds": round(total_execution_time, 2),
-            "total_time_minutes": round(total_execution_time / 60, 2),
-            "average_time_per_news": round(avg_execution_time, 2),
-            "min_time_seconds": round(min_execution_time, 2),
-            "max_time_seconds": round(max_execution_time, 2),
-            "median_time_seconds": round(median_execution_time, 2)
-        },
-        "confidence_distribution": {
-            "alta": sum(1 for entry in fraud_news if entry['analysis'].get('confidence') == 'alta'),
-            "média": sum(1 for entry in fraud_news if entry['analysis'].get('confidence') == 'média'),
-            "baixa": sum(1 for entry in fraud_news if entry['analysis'].get('confidence') == 'baixa')
-        }
-    }
-    
     metrics_path = Path(metrics_file)
     with open(metrics_path, 'w', encoding='utf-8') as f:
         json.dump(metrics_data, f, ensure_ascii=False, indent=2)
     
     print(f"Métricas de performance salvas em: {metrics_file}")
     
-    csv_path = Path(csv_file)
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        if fraud_news_with_companies:
-            fieldnames = ['file', 'title', 'url', 'companies', 'people', 'fraud_types', 'confidence', 'summary', 'execution_time_seconds']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(fraud_news_with_companies)
-            print(f"CSV com notícias de fraude empresarial salvo em: {csv_file}")
-        else:
-            print(f"⚠ Nenhuma notícia com empresas ou pessoas identificadas - CSV não criado")
+    # Mesmas colunas do salvamento incremental (as linhas vêm de build_csv_row)
+    if fraud_news_with_companies:
+        save_csv_incremental(csv_file, fraud_news_with_companies)
+        print(f"CSV com notícias de fraude empresarial salvo em: {csv_file}")
+    else:
+        print(f"⚠ Nenhuma notícia com empresas ou pessoas identificadas - CSV não criado")
     
     print(f"\n{'='*70}")
     print("RESUMO DAS FRAUDES COM EMPRESAS/PESSOAS IDENTIFICADAS:")
@@ -588,14 +736,23 @@ if __name__ == "__main__":
     OUTPUT_CSV = "/home/paulo/projects/main-server/.PAULO/fraud_news_ndmais_with_companies.csv"
     OUTPUT_METRICS = "/home/paulo/projects/main-server/.PAULO/performance_metrics_ndmais.json"
     
+    parser = argparse.ArgumentParser(description="Detector de fraudes empresariais em notícias")
+    parser.add_argument("--input-dir", default=INPUT_DIR, help="Pasta com os JSONs das notícias")
+    parser.add_argument("--output-file", default=OUTPUT_JSON, help="Arquivo JSON de resultados")
+    parser.add_argument("--csv-file", default=OUTPUT_CSV, help="CSV de notícias com empresas")
+    parser.add_argument("--metrics-file", default=OUTPUT_METRICS, help="Arquivo JSON de métricas")
+    parser.add_argument("--cache-file", default=DEFAULT_CACHE_FILE, help="Cache de respostas brutas do LLM (JSONL)")
+    args = parser.parse_args()
+    
     print("\n" + "="*70)
     print("DETECTOR DE FRAUDES EMPRESARIAIS EM NOTÍCIAS")
     print("="*70)
-    print(f"Diretório de entrada: {INPUT_DIR}")
-    print(f"Arquivo JSON de saída: {OUTPUT_JSON}")
-    print(f"Arquivo CSV de saída: {OUTPUT_CSV}")
-    print(f"Arquivo de métricas: {OUTPUT_METRICS}")
+    print(f"Diretório de entrada: {args.input_dir}")
+    print(f"Arquivo JSON de saída: {args.output_file}")
+    print(f"Arquivo CSV de saída: {args.csv_file}")
+    print(f"Arquivo de métricas: {args.metrics_file}")
     print(f"Modelo: {SELECTED_MODEL}")
     print("="*70 + "\n")
     
-    process_all_news(INPUT_DIR, OUTPUT_JSON, OUTPUT_CSV, OUTPUT_METRICS)
+    process_all_news(args.input_dir, args.output_file, args.csv_file, args.metrics_file,
+                     cache_file=args.cache_file)
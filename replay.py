@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Reprocessa as respostas brutas do LLM guardadas no cache (gravado pelo main.py
+e pelo job_runner.py), sem chamar o modelo, e compara o resultado com um conjunto de referência
+montado a partir dos CSVs de resultados já existentes.
+
+Serve para avaliar mudanças em _parse_json_response, no pós-processamento de
+entidades ou na montagem do CSV: todo o pipeline pós-LLM roda em paralelo sobre
+milhares de respostas em segundos.
+
+Referência: cada CSV (ex.: fraud_news_ndmais_with_companies.csv) lista as notícias
+de fraude com empresas. Por isso o rótulo avaliado é o mesmo que o CSV codifica,
+"fraude com empresas" (is_fraud_related e companies_involved não vazio, ou seja,
+a notícia gera linha no CSV); notícias do corpus que não estão no CSV são negativas.
+No cache, o corpus é o nome dado no job_runner.py ou o nome da pasta de entrada
+no main.py.
+
+Uso:
+    python3 replay.py \\
+        --reference ndmais_articles_json=fraud_news_ndmais_with_companies.csv \\
+        --reference 983json=fraud_news_FROM_983_pt1.csv \\
+        --reference 983json=fraud_news_FROM_983_pt2.csv \\
+        --csv-file replay_ndmais.csv --report-file replay_report.json
+"""
+
+import os
+import re
+import csv
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from main import DEFAULT_CACHE_FILE, FraudDetector, default_analysis, postprocess, save_csv_incremental
+
+ALL_CORPORA = "*"  # Chave de referência que vale para todos os corpora
+CHUNK_SIZE = 500
+
+_detector: Optional[FraudDetector] = None
+
+
+def _init_worker():
+    global _detector
+    _detector = FraudDetector()
+
+
+def _replay_chunk(records: List[Dict]) -> List[Dict]:
+    """
+    Roda o pipeline pós-LLM para um lote de respostas: o mesmo parse do
+    FraudDetector e o mesmo postprocess usado pelo main.py e pelo job_runner.py.
+    """
+    outcomes = []
+    for record in records:
+        analysis = _detector._parse_json_response(record['raw_response'].strip(), default_analysis())
+        analysis["execution_time_seconds"] = record['analysis'].get('execution_time_seconds', 0)
+        _, csv_row = postprocess(record['file'], record.get('title', ''), record.get('url', ''), '', analysis)
+        outcomes.append({
+            "corpus": record['corpus'],
+            "file": record['file'],
+            "analysis": analysis,
+            "csv_row": csv_row
+        })
+    return outcomes
+
+
+def load_responses(cache_file: str) -> tuple:
+    """
+    Lê o cache e separa os registros com resposta bruta (replay possível) dos antigos sem ela.
+
+    O cache é append-only: a mesma requisição pode aparecer várias vezes (retomadas
+    do main.py reanalisam notícias sem fraude) e a mesma notícia pode ter respostas de
+    versões diferentes do prompt/modelo. Como no ResultCache, vale a última linha de
+    cada impressão digital; depois, fica só a resposta mais recente de cada
+    (corpus, arquivo), para que cada notícia seja avaliada uma única vez.
+    """
+    by_fingerprint = {}
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            # Reinserir para que a ordem do dicionário reflita a última gravação
+            by_fingerprint.pop(record['fingerprint'], None)
+            by_fingerprint[record['fingerprint']] = record
+
+    by_article = {}
+    for record in by_fingerprint.values():
+        key = (record['corpus'], record['file'])
+        by_article.pop(key, None)
+        by_article[key] = record
+
+    records = [record for record in by_article.values() if record.get('raw_response') is not None]
+    return records, len(by_article) - len(records)
+
+
+def load_reference(references: Dict[str, List[str]]) -> Dict[str, Dict[str, Dict]]:
+    """
+    Monta o conjunto de referência {corpus: {arquivo: {"companies": set, "people": set}}}
+    a partir dos CSVs de resultados.
+    """
+    csv.field_size_limit(sys.maxsize)  # Coluna text pode ser muito longa
+    reference = {}
+    for corpus, csv_files in references.items():
+        labeled = reference.setdefault(corpus, {})
+        for csv_file in csv_files:
+            with open(csv_file, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    labeled[row['file']] = {
+                        "companies": _split_entities(row.get('companies', '')),
+                        "people": _split_entities(row.get('people', ''), strip_role=True)
+                    }
+    return reference
+
+
+def _normalize_entity(name: str, strip_role: bool = False) -> str:
+    if strip_role:
+        # "João Silva (empresário)" -> "João Silva": o papel varia entre execuções
+        name = re.sub(r"\s*\(.*?\)\s*$", "", name)
+    name = re.sub(r"\s+", " ", name).strip().strip(".,;").casefold()
+    return name
+
+
+def _split_entities(value: str, strip_role: bool = False) -> set:
+    entities = (_normalize_entity(item, strip_role) for item in (value or '').split(';'))
+    return {entity for entity in entities if entity}
+
+
+def _precision_recall(tp: int, fp: int, fn: int) -> Dict:
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "tp": tp, "fp": fp, "fn": fn,
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1": round(f1, 4)
+    }
+
+
+def evaluate(outcomes: List[Dict], reference: Dict[str, Dict[str, Dict]]) -> Dict:
+    """
+    Precisão/recall de "fraude com empresas" (a notícia gera linha no CSV, que é o
+    que os CSVs de referência registram) e das entidades (contagem micro sobre pares
+    arquivo-entidade) para as notícias dos corpora que têm referência.
+    """
+    counts = {key: [0, 0, 0] for key in ("fraud_with_companies", "companies", "people")}
+    evaluated = 0
+    for outcome in outcomes:
+        labeled = reference.get(outcome['corpus'], reference.get(ALL_CORPORA))
+        if labeled is None:
+            continue
+        evaluated += 1
+        expected = labeled.get(outcome['file'])
+        analysis = outcome['analysis']
+
+        predicted_fraud = outcome['csv_row'] is not None
+        if predicted_fraud and expected:
+            counts["fraud_with_companies"][0] += 1
+        elif predicted_fraud:
+            counts["fraud_with_companies"][1] += 1
+        elif expected:
+            counts["fraud_with_companies"][2] += 1
+
+        for key, field, strip_role in (("companies", "companies_involved", False),
+                                       ("people", "people_involved", True)):
+            predicted = set()
+            if predicted_fraud:
+                predicted = {_normalize_entity(name, strip_role) for name in analysis[field]} - {""}
+            gold = expected[key] if expected else set()
+            counts[key][0] += len(predicted & gold)
+            counts[key][1] += len(predicted - gold)
+            counts[key][2] += len(gold - predicted)
+
+    return {
+        "evaluated": evaluated,
+        **{key: _precision_recall(*values) for key, values in counts.items()}
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay das respostas do LLM guardadas no cache, sem chamar o modelo")
+    parser.add_argument("--cache-file", default=DEFAULT_CACHE_FILE, help="Cache de respostas do main.py/job_runner.py (JSONL)")
+    parser.add_argument("--reference", action="append", default=[], metavar="[CORPUS=]CSV",
+                        help="CSV de resultados usado como referência (pode ser repetido)")
+    parser.add_argument("--corpus", action="append", default=[], metavar="NOME",
+                        help="Reprocessar apenas estes corpora (padrão: todos)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Processos em paralelo")
+    parser.add_argument("--csv-file", help="Salvar o CSV remontado a partir do replay")
+    parser.add_argument("--report-file", help="Salvar o relatório de avaliação em JSON")
+    args = parser.parse_args()
+
+    if not Path(args.cache_file).exists():
+        print(f"ERRO: Cache {args.cache_file} não encontrado!")
+        sys.exit(1)
+
+    references = {}
+    for value in args.reference:
+        corpus, csv_file = (value.split("=", 1) if "=" in value else (ALL_CORPORA, value))
+        references.setdefault(corpus, []).append(csv_file)
+    reference = load_reference(references) if references else None
+
+    records, without_response = load_responses(args.cache_file)
+    if args.corpus:
+        records = [record for record in records if record['corpus'] in args.corpus]
+
+    print(f"\n{'='*70}")
+    print("REPLAY DAS RESPOSTAS DO LLM")
+    print(f"{'='*70}")
+    print(f"Cache: {args.cache_file}")
+    print(f"Notícias para replay: {len(records)} (última resposta de cada notícia)")
+    if without_response:
+        print(f"⚠ Notícias cuja resposta mais recente não tem resposta bruta (anteriores ao replay): {without_response}")
+    print(f"Processos: {args.jobs}")
+    print(f"{'='*70}\n")
+
+    chunks = [records[i:i + CHUNK_SIZE] for i in range(0, len(records), CHUNK_SIZE)]
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker) as pool:
+        for chunk_outcomes in pool.map(_replay_chunk, chunks):
+            outcomes.extend(chunk_outcomes)
+
+    # Diferenças em relação à análise registrada na execução original
+    changed = sum(
+        1 for record, outcome in zip(records, outcomes)
+        if {k: v for k, v in record['analysis'].items() if k != 'error'} != {k: v for k, v in outcome['analysis'].items() if k != 'error'}
+    )
+    parse_failures = sum(1 for outcome in outcomes if outcome['analysis'].get('error') == "json_decode")
+    csv_rows = [outcome['csv_row'] for outcome in outcomes if outcome['csv_row']]
+
+    report = {
+        "cache_file": args.cache_file,
+        "replayed": len(outcomes),
+        "parse_failures": parse_failures,
+        "changed_vs_original": changed,
+        "fraud_related": sum(1 for outcome in outcomes if outcome['analysis']['is_fraud_related']),
+        "csv_rows": len(csv_rows)
+    }
+    if reference is not None:
+        report["evaluation"] = evaluate(outcomes, reference)
+
+    print(f"Respostas reprocessadas: {report['replayed']}")
+    print(f"Falhas de parse: {report['parse_failures']}")
+    print(f"Análises diferentes da execução original: {report['changed_vs_original']}")
+    print(f"Relacionadas a fraudes: {report['fraud_related']}")
+    print(f"Linhas no CSV: {report['csv_rows']}")
+    if "evaluation" in report:
+        evaluation = report["evaluation"]
+        print(f"\nAvaliação contra a referência ({evaluation['evaluated']} notícias):")
+        for key in ("fraud_with_companies", "companies", "people"):
+            m = evaluation[key]
+            print(f"  {key:<20} precisão: {m['precision']:.2%}  recall: {m['recall']:.2%}  F1: {m['f1']:.2%}  "
+                  f"(TP {m['tp']}, FP {m['fp']}, FN {m['fn']})")
+
+    if args.csv_file:
+        save_csv_incremental(args.csv_file, csv_rows)
+        print(f"\nCSV remontado salvo em: {args.csv_file}")
+    if args.report_file:
+        with open(args.report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Relatório salvo em: {args.report_file}")
+    print(f"{'='*70}\n")
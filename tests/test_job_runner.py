@@ -0,0 +1,188 @@
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import job_runner
+from job_runner import (
+    CheckpointStore,
+    Corpus,
+    CostModel,
+    JobRunner,
+    ProgressTracker,
+    ResultCache,
+    article_date,
+)
+
+
+def _write_corpus(directory, sizes, extra=None):
+    directory.mkdir()
+    for index, size in enumerate(sizes):
+        news = {"title": f"t{index}", "url": f"u{index}", "text": "x" * size}
+        news.update((extra or {}).get(index, {}))
+        (directory / f"n_{index:03d}.json").write_text(json.dumps(news), encoding='utf-8')
+
+
+def _load_corpus(tmp_path, name, sizes, extra=None):
+    _write_corpus(tmp_path / name, sizes, extra)
+    corpus = Corpus(name, str(tmp_path / name), str(tmp_path))
+    assert corpus.load(CheckpointStore(str(tmp_path / "checkpoints.jsonl")))
+    return corpus
+
+
+def test_cost_model_fits_linear_latency():
+    model = CostModel()
+    for size in (1000, 2000, 4000, 8000):
+        model.add(size, 2.0 + size / 1000)
+    model.fit()
+    assert model.slope == pytest.approx(0.001)
+    assert model.intercept == pytest.approx(2.0)
+    assert model.predict(10000) == pytest.approx(12.0)
+
+
+def test_cost_model_without_correlation_stays_proportional_to_size():
+    model = CostModel()
+    model.add(1000, 5.0)
+    model.add(1000, 7.0)
+    model.add(0, 3.0)  # Ignorada: tamanho inválido
+    model.fit()
+    assert model.samples == 2
+    assert model.intercept == 0.0
+    assert model.predict(2000) == pytest.approx(12.0)
+    assert model.predict(1000) < model.predict(2000)
+
+
+def test_progress_tracker_eta_uses_recent_window(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(job_runner.time, "time", lambda: now[0])
+    monkeypatch.setattr(job_runner, "ETA_WINDOW", 2)
+    tracker = ProgressTracker(total_items=4, total_cost=40.0)
+
+    # Duas notícias lentas seguidas de duas rápidas: só as duas últimas entram na janela
+    for timestamp in (100.0, 200.0, 210.0, 220.0):
+        now[0] = timestamp
+        tracker.done(5.0)
+    assert tracker.remaining_items == 0
+    assert tracker.remaining_cost == 20.0
+    now[0] = 220.0
+    assert "6.0 notícias/min (últimas 2)" in tracker.report()
+
+    tracker.remaining_cost = 60.0  # 10 de custo em 20s na janela -> 0.5/s
+    assert "ETA: 2m00s" in tracker.report()
+
+
+def test_progress_tracker_ignores_cache_hits_in_throughput(monkeypatch):
+    monkeypatch.setattr(job_runner.time, "time", lambda: 0.0)
+    tracker = ProgressTracker(total_items=2, total_cost=10.0)
+    tracker.done(5.0, analyzed=False)
+    assert tracker.completed == 1
+    assert tracker.remaining_cost == 5.0
+    assert "ETA: --" in tracker.report()
+
+
+def test_next_job_alternates_corpora_shortest_first(tmp_path):
+    a = _load_corpus(tmp_path, "a", [300, 100, 200])
+    b = _load_corpus(tmp_path, "b", [50, 500])
+    runner = JobRunner([a, b], ResultCache(str(tmp_path / "cache.jsonl")))
+
+    order = []
+    while (job := runner._next_job()) is not None:
+        corpus, json_file, _ = job
+        order.append((corpus.name, json_file.name))
+    assert order == [
+        ("a", "n_001.json"), ("b", "n_000.json"),
+        ("a", "n_002.json"), ("b", "n_001.json"),
+        ("a", "n_000.json"),
+    ]
+
+
+def test_next_job_serves_priority_corpus_first(tmp_path):
+    a = _load_corpus(tmp_path, "a", [100, 200])
+    b = _load_corpus(tmp_path, "b", [100, 200])
+    runner = JobRunner([a, b], ResultCache(str(tmp_path / "cache.jsonl")), priority={"b"})
+
+    names = [runner._next_job()[0].name for _ in range(4)]
+    assert names == ["b", "b", "a", "a"]
+
+
+def test_cost_model_samples_keyed_by_file_not_size(tmp_path):
+    a = _load_corpus(tmp_path, "a", [100, 100])
+    cache = ResultCache(str(tmp_path / "cache.jsonl"))
+    for index, seconds in enumerate((2.0, 4.0)):
+        analysis = {"is_fraud_related": False, "execution_time_seconds": seconds}
+        cache.put(f"fp{index}", "a", f"n_{index:03d}.json", analysis, "{}")
+    runner = JobRunner([a], cache)
+    assert runner.cost_model.samples == 2
+
+
+def test_article_date_formats():
+    assert article_date({"date": "2024-03-15T10:00:00"}) == "2024-03-15"
+    assert article_date({"data": "Publicado em 15/03/2024 às 10h"}) == "2024-03-15"
+    assert article_date({"published": "2024-03-15"}) is None
+    assert article_date({"published": "2024-03-15"}, ("published",)) == "2024-03-15"
+
+
+def test_priority_since_uses_dates_and_warns_when_missing(tmp_path, capsys):
+    dated = _load_corpus(tmp_path, "dated", [100, 200], extra={1: {"date": "2025-01-02"}, 0: {"date": "2020-01-01"}})
+    undated = _load_corpus(tmp_path, "undated", [100, 200])
+    JobRunner([dated, undated], ResultCache(str(tmp_path / "cache.jsonl")), priority_since="2024-01-01")
+
+    assert dated.pending[0][3].name == "n_001.json"  # Mais longa, mas recente
+    output = capsys.readouterr().out
+    assert "[undated] Nenhuma notícia pendente tem data" in output
+    assert "[dated] Nenhuma" not in output
+
+
+def test_json_decode_is_checkpointed_and_transient_errors_retried(tmp_path, monkeypatch):
+    corpus = _load_corpus(tmp_path, "a", [100, 200])
+    cache = ResultCache(str(tmp_path / "cache.jsonl"))
+    runner = JobRunner([corpus], cache, workers=1)
+
+    def fake_analyze(text, title, timeout):
+        if title == "t0":
+            return "{não é json", dict(job_runner.default_analysis(), error="json_decode")
+        return None, dict(job_runner.default_analysis(), error="Connection refused")
+    monkeypatch.setattr(runner.detector, "analyze_fraud_with_response", fake_analyze)
+    runner.run()
+    cache.close()
+
+    assert CheckpointStore(str(tmp_path / "checkpoints.jsonl")).processed("a") == {"n_000.json"}
+    assert (corpus.parse_failures, corpus.failures, corpus.processed) == (1, 1, 1)
+    # A resposta inválida é reaproveitada do cache; a falha de conexão não foi guardada
+    reloaded = ResultCache(str(tmp_path / "cache.jsonl"))
+    fingerprints = [record['fingerprint'] for record in reloaded.records()]
+    assert len(fingerprints) == 1
+    assert reloaded.get(fingerprints[0])['error'] == "json_decode"
+
+
+def _run_cli(*args):
+    return subprocess.run([sys.executable, "job_runner.py", *args], capture_output=True, text=True,
+                          cwd=Path(job_runner.__file__).parent)
+
+
+@pytest.mark.parametrize("value", ["15/03/2024", "2024-3-1", "2024-02-30"])
+def test_priority_since_rejects_invalid_dates(value):
+    completed = _run_cli("--corpus", "a=inexistente", "--priority-since", value)
+    assert completed.returncode == 2
+    assert "--priority-since espera uma data AAAA-MM-DD" in completed.stderr
+
+
+def test_parse_since_normalizes_date():
+    assert job_runner._parse_since("2024-03-01") == "2024-03-01"
+    assert job_runner._parse_since("20240301") == "2024-03-01"
+
+
+@pytest.mark.parametrize("args, message", [
+    (["--corpus", "semigual"], "--corpus espera NOME=VALOR"),
+    (["--corpus", "a=x", "--start-from", "a=dez"], "--start-from espera NOME=N com N inteiro"),
+    (["--corpus", "a=x", "--start-from", "b=10"], "Corpus não informado em --corpus: b"),
+    (["--corpus", "a=x", "--priority", "b"], "Corpus não informado em --corpus: b"),
+    (["--corpus", "a=x", "--workers", "0"], "--workers deve ser pelo menos 1"),
+])
+def test_cli_reports_invalid_arguments(args, message):
+    completed = _run_cli(*args)
+    assert completed.returncode == 2
+    assert message in completed.stderr
+    assert "Traceback" not in completed.stderr
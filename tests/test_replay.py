@@ -0,0 +1,132 @@
+import json
+
+import main
+import replay
+from main import default_analysis, postprocess
+from replay import _normalize_entity, _replay_chunk, evaluate, load_responses
+
+
+def _analysis(fraud, companies=(), people=()):
+    return dict(default_analysis(), is_fraud_related=fraud,
+                companies_involved=list(companies), people_involved=list(people))
+
+
+def _record(file_name, raw, corpus="c"):
+    return {"corpus": corpus, "file": file_name, "title": "t", "url": "u",
+            "raw_response": raw, "analysis": {"execution_time_seconds": 1.5}}
+
+
+def test_postprocess_splits_json_entry_and_csv_row():
+    assert postprocess("a.json", "t", "u", "x", _analysis(False)) == (None, None)
+
+    entry, row = postprocess("a.json", "t", "u", "x", _analysis(True, people=["João (prefeito)"]))
+    assert entry["file"] == "a.json" and row is None
+
+    entry, row = postprocess("a.json", "t", "u", "x", _analysis(True, ["A Ltda.", "B S.A."]))
+    assert entry["analysis"]["companies_involved"] == ["A Ltda.", "B S.A."]
+    assert row["companies"] == "A Ltda.; B S.A."
+
+
+def test_normalize_entity():
+    assert _normalize_entity("  Construtora  ABC Ltda. ") == "construtora abc ltda"
+    assert _normalize_entity("João Silva (empresário)", strip_role=True) == "joão silva"
+    assert _normalize_entity("João Silva (empresário)") == "joão silva (empresário)"
+
+
+def test_replay_chunk_uses_shared_postprocess():
+    replay._init_worker()
+    raw = '```json\n{"is_fraud_related": true, "companies_involved": ["A Ltda."], "people_involved": []}\n```'
+    outcomes = _replay_chunk([
+        _record("a.json", raw),
+        _record("b.json", '{"is_fraud_related": true, "companies_involved": []}'),
+        _record("c.json", "não é json"),
+    ])
+    assert outcomes[0]["csv_row"]["companies"] == "A Ltda."
+    assert outcomes[0]["analysis"]["execution_time_seconds"] == 1.5
+    assert outcomes[1]["analysis"]["is_fraud_related"] and outcomes[1]["csv_row"] is None
+    assert outcomes[2]["analysis"]["error"] == "json_decode"
+
+
+def test_evaluate_scores_label_encoded_by_csv():
+    reference = {"c": {
+        "a.json": {"companies": {"a ltda"}, "people": {"joão"}},
+        "b.json": {"companies": {"b ltda"}, "people": set()},
+    }}
+
+    def outcome(file_name, analysis):
+        _, csv_row = postprocess(file_name, "t", "u", "", analysis)
+        return {"corpus": "c", "file": file_name, "analysis": analysis, "csv_row": csv_row}
+
+    outcomes = [
+        outcome("a.json", _analysis(True, ["A Ltda.", "Outra Ltda."], ["João (prefeito)"])),  # TP
+        outcome("b.json", _analysis(False)),                                             # FN
+        outcome("c.json", _analysis(True, people=["Maria (servidora)"])),                # Fraude sem empresas: não é FP
+        outcome("d.json", _analysis(True, ["D Ltda."])),                                 # FP
+        {"corpus": "outro", "file": "e.json", "analysis": _analysis(True, ["E"]), "csv_row": {}},  # Sem referência
+    ]
+    result = evaluate(outcomes, reference)
+
+    assert result["evaluated"] == 4
+    assert result["fraud_with_companies"] == {"tp": 1, "fp": 1, "fn": 1, "precision": 0.5, "recall": 0.5, "f1": 0.5}
+    assert (result["companies"]["tp"], result["companies"]["fp"], result["companies"]["fn"]) == (1, 2, 1)
+    assert (result["people"]["tp"], result["people"]["fp"], result["people"]["fn"]) == (1, 0, 0)
+
+
+def test_process_all_news_stores_raw_responses(tmp_path, monkeypatch):
+    input_dir = tmp_path / "noticias"
+    input_dir.mkdir()
+    for index in range(2):
+        (input_dir / f"n_{index}.json").write_text(json.dumps({"title": f"t{index}", "url": "u", "text": "texto"}))
+
+    raw = '{"is_fraud_related": true, "companies_involved": ["A Ltda."], "people_involved": []}'
+
+    def fake_analysis(self, text, title, timeout=main.TIMEOUT_SECONDS):
+        return raw, self._parse_json_response(raw, default_analysis())
+
+    monkeypatch.setattr(main, "START_FROM", 0)
+    monkeypatch.setattr(main.FraudDetector, "analyze_fraud_with_response", fake_analysis)
+    cache_file = tmp_path / "cache.jsonl"
+    main.process_all_news(str(input_dir), str(tmp_path / "out.json"), str(tmp_path / "out.csv"),
+                          str(tmp_path / "metrics.json"), cache_file=str(cache_file))
+
+    records, without_response = load_responses(str(cache_file))
+    assert without_response == 0
+    assert [(r["corpus"], r["file"], r["raw_response"]) for r in records] == [
+        ("noticias", "n_0.json", raw), ("noticias", "n_1.json", raw)
+    ]
+
+
+def test_load_responses_deduplicates_cache_lines(tmp_path):
+    cache_file = tmp_path / "cache.jsonl"
+    lines = [
+        # Mesma requisição gravada três vezes (retomadas do main.py)
+        {"fingerprint": "f1", "corpus": "c", "file": "a.json", "raw_response": '{"v": 1}', "analysis": {}},
+        {"fingerprint": "f1", "corpus": "c", "file": "a.json", "raw_response": '{"v": 1}', "analysis": {}},
+        {"fingerprint": "f1", "corpus": "c", "file": "a.json", "raw_response": '{"v": 1}', "analysis": {}},
+        # Mesma notícia com outro prompt: vale a mais recente
+        {"fingerprint": "f2", "corpus": "c", "file": "b.json", "raw_response": "antiga", "analysis": {}},
+        {"fingerprint": "f3", "corpus": "c", "file": "b.json", "raw_response": "nova", "analysis": {}},
+        # Mesmo arquivo em outro corpus é outra notícia
+        {"fingerprint": "f4", "corpus": "d", "file": "a.json", "raw_response": "{}", "analysis": {}},
+        # Registro antigo, sem resposta bruta
+        {"fingerprint": "f5", "corpus": "c", "file": "e.json", "analysis": {}},
+    ]
+    cache_file.write_text("".join(json.dumps(line) + "\n" for line in lines) + "linha truncada", encoding='utf-8')
+
+    records, without_response = load_responses(str(cache_file))
+
+    assert without_response == 1
+    assert sorted((r["corpus"], r["file"], r["raw_response"]) for r in records) == [
+        ("c", "a.json", '{"v": 1}'), ("c", "b.json", "nova"), ("d", "a.json", "{}")
+    ]
+
+    replay._init_worker()
+    reference = {"c": {}}
+    raw_fraud = '{"is_fraud_related": true, "companies_involved": ["A Ltda."]}'
+    cache_file.write_text("".join(
+        json.dumps({"fingerprint": "f1", "corpus": "c", "file": "a.json", "raw_response": raw_fraud, "analysis": {}}) + "\n"
+        for _ in range(3)
+    ), encoding='utf-8')
+    records, _ = load_responses(str(cache_file))
+    result = evaluate(_replay_chunk(records), reference)
+    assert result["fraud_with_companies"]["fp"] == 1